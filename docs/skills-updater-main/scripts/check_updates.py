@@ -11,26 +11,69 @@ Examples:
     python check_updates.py --json             # Output as JSON
 """
 
-import json
+import os
+import re
 import sys
-import argparse
-import io
+import hashlib
+import http.client
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-
-# Fix Windows console encoding
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from enum import Enum
-import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
-# Import i18n module
+# Import sibling modules: relative imports when run as part of the scripts package
+# (python -m scripts.check_updates), otherwise from the script's own directory
 script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
-from i18n import get_i18n, t  # noqa: E402
+if __package__:
+    from .i18n import ensure_utf8_stdio, get_i18n, t
+    from .http_pool import HTTPError, pooled_get
+    from .json_compat import json_dumps, json_loads
+else:
+    sys.path.insert(0, str(script_dir))
+    from i18n import ensure_utf8_stdio, get_i18n, t
+    from http_pool import HTTPError, pooled_get
+    from json_compat import json_dumps, json_loads
+
+# Fix Windows console encoding
+ensure_utf8_stdio()
+
+# Maximum number of concurrent remote checks
+MAX_WORKERS = 8
+
+# GitHub remote URLs: https://github.com/owner/repo(.git), git@github.com:owner/repo(.git),
+# ssh://git@github.com/owner/repo(.git)
+_GITHUB_URL_RE = re.compile(
+    r'^(?:(?:https?|ssh|git)://)?(?:[^@/\s]+@)?(?:www\.)?github\.com[/:]([^/\s]+/[^/\s]+?)(?:\.git)?/?$'
+)
+
+# GitHub resolves HEAD to the repo's default branch (main, master, trunk, ...) for both
+# raw.githubusercontent.com and the commits API, so no main-then-fallback probing is needed
+DEFAULT_BRANCH_REF = "HEAD"
+
+# Number of leading hex digits used to compare and display commit SHAs
+SHA_PREFIX_LEN = 12
+
+# Responses fetched within this many seconds are reused without revalidation
+MEMORY_CACHE_TTL = 60
+
+# Parsed JSON config files: path -> ((st_mtime_ns, st_size), data)
+_json_file_cache: Dict[Path, Tuple[Tuple[int, int], Dict]] = {}
+
+# In-process response cache: url -> (fetched_at, body)
+_memory_cache: Dict[str, Tuple[float, str]] = {}
+
+# GitHub API rate-limit budget, updated from X-RateLimit-* response headers.
+# Once fewer than RATE_LIMIT_LOW_WATERMARK calls remain, API calls are made one
+# at a time and spread out until the reset (at most RATE_LIMIT_MAX_DELAY apart).
+GITHUB_API_HOST = "api.github.com"
+RATE_LIMIT_LOW_WATERMARK = MAX_WORKERS
+RATE_LIMIT_MAX_DELAY = 5.0
+_rate_limit: Dict[str, Optional[int]] = {"remaining": None, "reset": None}
+_rate_limit_lock = threading.Lock()
 
 
 class UpdateStatus(Enum):
@@ -40,8 +83,7 @@ class UpdateStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
-class SkillInfo:
+class SkillInfo(NamedTuple):
     name: str
     marketplace: str
     local_version: str
@@ -53,29 +95,47 @@ class SkillInfo:
     error_message: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
 def get_plugins_dir() -> Path:
-    """Get the Claude Code plugins directory."""
+    """Get the Claude Code plugins directory (resolved once per process)."""
     return Path.home() / ".claude" / "plugins"
 
 
+def get_cache_dir() -> Path:
+    """Get the directory for cached HTTP responses."""
+    return get_plugins_dir() / ".update_cache"
+
+
+def load_json_file(path: Path, default: Dict) -> Dict:
+    """
+    Load a JSON file, re-parsing only when its mtime or size changed.
+
+    The returned dict is shared between calls; treat it as read-only.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return default
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _json_file_cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        data = json_loads(f.read())
+    _json_file_cache[path] = (key, data)
+    return data
+
+
 def load_installed_plugins() -> Dict:
     """Load the installed_plugins.json file."""
-    plugins_file = get_plugins_dir() / "installed_plugins.json"
-    if not plugins_file.exists():
-        return {"version": 2, "plugins": {}}
-
-    with open(plugins_file, encoding='utf-8') as f:
-        return json.load(f)
+    return load_json_file(get_plugins_dir() / "installed_plugins.json", {"version": 2, "plugins": {}})
 
 
 def load_known_marketplaces() -> Dict:
     """Load the known_marketplaces.json file."""
-    marketplaces_file = get_plugins_dir() / "known_marketplaces.json"
-    if not marketplaces_file.exists():
-        return {}
-
-    with open(marketplaces_file, encoding='utf-8') as f:
-        return json.load(f)
+    return load_json_file(get_plugins_dir() / "known_marketplaces.json", {})
 
 
 def parse_plugin_key(key: str) -> Tuple[str, str]:
@@ -86,6 +146,13 @@ def parse_plugin_key(key: str) -> Tuple[str, str]:
     return key, "unknown"
 
 
+@lru_cache(maxsize=128)
+def _parse_github_repo_url(url: str) -> Optional[str]:
+    """Parse a git URL into owner/repo, or None if it is not a GitHub URL."""
+    match = _GITHUB_URL_RE.match(url.strip())
+    return match.group(1) if match else None
+
+
 def get_github_repo_from_marketplace(marketplace_name: str, marketplaces: Dict) -> Optional[str]:
     """Get the GitHub repo from marketplace info."""
     marketplace_info = marketplaces.get(marketplace_name, {})
@@ -94,67 +161,140 @@ def get_github_repo_from_marketplace(marketplace_name: str, marketplaces: Dict)
     if source.get("source") == "github":
         return source.get("repo")
     elif source.get("source") == "git":
-        url = source.get("url", "")
-        # Parse git URL to get owner/repo
-        if "github.com" in url:
-            # Handle formats: https://github.com/owner/repo.git or git@github.com:owner/repo.git
-            url = url.replace(".git", "")
-            if "github.com/" in url:
-                return url.split("github.com/")[-1]
-            elif "github.com:" in url:
-                return url.split("github.com:")[-1]
+        return _parse_github_repo_url(source.get("url", ""))
 
     return None
 
 
-def fetch_remote_marketplace_json(repo: str) -> Optional[Dict]:
-    """Fetch marketplace.json from GitHub repo."""
-    url = f"https://raw.githubusercontent.com/{repo}/main/.claude-plugin/marketplace.json"
+def github_api_headers() -> Dict[str, str]:
+    """Headers for api.github.com, authenticated when GITHUB_TOKEN / GH_TOKEN is set."""
+    headers = {
+        "User-Agent": "skills-updater/1.0",
+        "Accept": "application/vnd.github.v3+json"
+    }
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
 
+def _record_rate_limit(headers: http.client.HTTPMessage):
+    """Remember the rate-limit budget reported by the GitHub API."""
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "skills-updater/1.0"})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            return json.loads(response.read().decode())
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            # Try HEAD branch instead of main
-            url_head = url.replace("/main/", "/HEAD/")
+        remaining = int(headers["X-RateLimit-Remaining"])
+        reset = int(headers["X-RateLimit-Reset"])
+    except (KeyError, TypeError, ValueError):
+        return
+    _rate_limit["remaining"] = remaining
+    _rate_limit["reset"] = reset
+
+
+def _rate_limit_delay() -> float:
+    """Seconds to wait before the next API call so the remaining budget lasts until reset."""
+    remaining, reset = _rate_limit["remaining"], _rate_limit["reset"]
+    if remaining is None or reset is None:
+        return 0.0
+    return min(max(0.0, (reset - time.time()) / max(remaining, 1)), RATE_LIMIT_MAX_DELAY)
+
+
+def http_get(url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    GET a URL over a pooled keep-alive connection.
+
+    Calls to the GitHub API are throttled once the rate-limit budget runs low.
+
+    Returns: (status, headers, body)
+    """
+    if urlsplit(url).netloc != GITHUB_API_HOST:
+        return pooled_get(url, headers)
+
+    remaining = _rate_limit["remaining"]
+    if remaining is None or remaining >= RATE_LIMIT_LOW_WATERMARK:
+        result = pooled_get(url, headers)
+    else:
+        with _rate_limit_lock:
+            time.sleep(_rate_limit_delay())
+            result = pooled_get(url, headers)
+
+    _record_rate_limit(result[1])
+    return result
+
+
+def cached_get(url: str, headers: Dict[str, str]) -> str:
+    """
+    GET a URL, revalidating against an on-disk cache with ETag / Last-Modified.
+
+    A 304 response returns the cached body without transferring it again, and
+    does not count against GitHub's API rate limit. Raises HTTPError for other
+    error statuses so callers can apply their own fallbacks.
+    """
+    now = time.time()
+    hit = _memory_cache.get(url)
+    if hit and now - hit[0] < MEMORY_CACHE_TTL:
+        return hit[1]
+
+    cache_file = get_cache_dir() / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    cached = None
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    request_headers = dict(headers)
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    status, response_headers, data = http_get(url, request_headers)
+
+    if status == 304 and cached:
+        body = cached["body"]
+    elif status == 200:
+        body = data.decode()
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
             try:
-                req = urllib.request.Request(url_head, headers={"User-Agent": "skills-updater/1.0"})
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    return json.loads(response.read().decode())
-            except Exception:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, "wb") as f:
+                    f.write(json_dumps({
+                        "url": url,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "body": body,
+                        "fetched_at": now
+                    }))
+            except OSError:
                 pass
-        return None
-    except Exception:
-        return None
+    else:
+        raise HTTPError(url, status)
 
+    _memory_cache[url] = (now, body)
+    return body
 
-def fetch_remote_commit_sha(repo: str) -> Optional[str]:
-    """Fetch the latest commit SHA from GitHub."""
-    url = f"https://api.github.com/repos/{repo}/commits/main"
 
+def fetch_json(url: str, headers: Dict[str, str]) -> Optional[Dict]:
+    """Fetch and parse a JSON document, returning None on any failure."""
     try:
-        req = urllib.request.Request(url, headers={
-            "User-Agent": "skills-updater/1.0",
-            "Accept": "application/vnd.github.v3+json"
-        })
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            return data.get("sha")
+        return json_loads(cached_get(url, headers))
     except Exception:
-        # Try HEAD branch
-        url_head = url.replace("/main", "/HEAD")
-        try:
-            req = urllib.request.Request(url_head, headers={
-                "User-Agent": "skills-updater/1.0",
-                "Accept": "application/vnd.github.v3+json"
-            })
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                return data.get("sha")
-        except Exception:
-            return None
+        return None
+
+
+def fetch_remote_marketplace_json(repo: str) -> Optional[Dict]:
+    """Fetch marketplace.json from the repo's default branch."""
+    url = f"https://raw.githubusercontent.com/{repo}/{DEFAULT_BRANCH_REF}/.claude-plugin/marketplace.json"
+    return fetch_json(url, {"User-Agent": "skills-updater/1.0"})
+
+
+def fetch_remote_commit_sha(repo: str) -> Optional[str]:
+    """Fetch the latest commit SHA on the repo's default branch."""
+    url = f"https://{GITHUB_API_HOST}/repos/{repo}/commits/{DEFAULT_BRANCH_REF}"
+    data = fetch_json(url, github_api_headers())
+    return data.get("sha") if data else None
 
 
 def get_skill_version_from_marketplace_json(marketplace_json: Dict, skill_name: str) -> Optional[str]:
@@ -166,6 +306,25 @@ def get_skill_version_from_marketplace_json(marketplace_json: Dict, skill_name:
     return None
 
 
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """
+    Parse a dotted numeric version into a comparable tuple.
+
+    Trailing zero components are dropped so that "1.2" and "1.2.0" compare equal.
+    Returns None for versions with non-numeric components.
+    """
+    try:
+        parts = [int(x) for x in version.split(".")]
+    except (AttributeError, ValueError):
+        return None
+
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+@lru_cache(maxsize=256)
 def compare_versions(local: str, remote: str) -> bool:
     """Compare versions. Returns True if remote is newer."""
     if local == remote:
@@ -176,40 +335,53 @@ def compare_versions(local: str, remote: str) -> bool:
         return True
 
     # Try semantic version comparison
-    try:
-        local_parts = [int(x) for x in local.split(".")]
-        remote_parts = [int(x) for x in remote.split(".")]
-
-        # Pad shorter version with zeros
-        max_len = max(len(local_parts), len(remote_parts))
-        local_parts.extend([0] * (max_len - len(local_parts)))
-        remote_parts.extend([0] * (max_len - len(remote_parts)))
-
+    local_parts = _parse_version(local)
+    remote_parts = _parse_version(remote)
+    if local_parts is not None and remote_parts is not None:
         return remote_parts > local_parts
-    except Exception:
-        # Fall back to string comparison
-        return local != remote
+
+    # Fall back to string comparison
+    return local != remote
 
 
+@lru_cache(maxsize=256)
 def compare_commit_sha(local_sha: Optional[str], remote_sha: Optional[str]) -> bool:
     """Compare commit SHAs. Returns True if different."""
     if not local_sha or not remote_sha:
         return False
 
-    # Handle short SHA comparison
-    min_len = min(len(local_sha), len(remote_sha))
-    return local_sha[:min_len] != remote_sha[:min_len]
-
-
-def check_skill_update(skill_name: str, marketplace: str, plugin_info: Dict, marketplaces: Dict) -> SkillInfo:
-    """Check if a skill has an available update."""
+    # Compare the shared prefix (at most SHA_PREFIX_LEN hex digits) as integers
+    n = min(len(local_sha), len(remote_sha), SHA_PREFIX_LEN)
+    try:
+        return int(local_sha[:n], 16) != int(remote_sha[:n], 16)
+    except ValueError:
+        return local_sha[:n] != remote_sha[:n]
+
+
+def needs_commit_check(local_version: Optional[str], remote_version: Optional[str]) -> bool:
+    """Whether the status must be decided by commit SHA because versions cannot be compared."""
+    return local_version in ["unknown", "", None] or not remote_version
+
+
+def check_skill_update(
+    skill_name: str,
+    marketplace: str,
+    plugin_info: Dict,
+    repo: Optional[str],
+    remote_marketplace: Optional[Dict],
+    remote_commit: Optional[str]
+) -> SkillInfo:
+    """
+    Check if a skill has an available update.
+
+    Remote data is fetched once per repo by the caller and passed in, so skills
+    sharing a marketplace do not re-download the same artifacts. remote_commit
+    may be None when no skill from the repo needed a commit comparison.
+    """
     local_version = plugin_info.get("version", "unknown")
     install_path = plugin_info.get("installPath", "")
     git_commit_sha = plugin_info.get("gitCommitSha")
 
-    # Get GitHub repo
-    repo = get_github_repo_from_marketplace(marketplace, marketplaces)
-
     if not repo:
         return SkillInfo(
             name=skill_name,
@@ -222,16 +394,12 @@ def check_skill_update(skill_name: str, marketplace: str, plugin_info: Dict, mar
             error_message="Could not determine GitHub repo"
         )
 
-    # Try to get remote version from marketplace.json
-    remote_marketplace = fetch_remote_marketplace_json(repo)
+    # Get remote version from marketplace.json
     remote_version = None
 
     if remote_marketplace:
         remote_version = get_skill_version_from_marketplace_json(remote_marketplace, skill_name)
 
-    # Fetch remote commit SHA as fallback
-    remote_commit = fetch_remote_commit_sha(repo)
-
     # Determine update status
     if local_version in ["unknown", "", None]:
         # Unknown local version - check by commit
@@ -269,12 +437,37 @@ def check_skill_update(skill_name: str, marketplace: str, plugin_info: Dict, mar
     )
 
 
+def fetch_repo_remote_data(repo: str, skills: List[Tuple[str, Dict]]) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Fetch a repo's marketplace.json and, only if some skill needs it, its latest commit SHA.
+
+    Each repo is handled start to finish by one worker, so a repo's commit lookup
+    starts as soon as its own marketplace.json arrives instead of waiting for
+    every other repo's.
+
+    Returns: (remote_marketplace, remote_commit)
+    """
+    remote_marketplace = fetch_remote_marketplace_json(repo)
+
+    # Only query the commits API when a version comparison cannot decide
+    if any(
+        needs_commit_check(
+            plugin_info.get("version", "unknown"),
+            get_skill_version_from_marketplace_json(remote_marketplace or {}, skill_name)
+        )
+        for skill_name, plugin_info in skills
+    ):
+        return remote_marketplace, fetch_remote_commit_sha(repo)
+
+    return remote_marketplace, None
+
+
 def check_all_updates(filter_skill: Optional[str] = None) -> List[SkillInfo]:
     """Check updates for all installed skills."""
     installed = load_installed_plugins()
     marketplaces = load_known_marketplaces()
 
-    results = []
+    args = []
 
     for key, plugin_list in installed.get("plugins", {}).items():
         if not plugin_list:
@@ -286,12 +479,43 @@ def check_all_updates(filter_skill: Optional[str] = None) -> List[SkillInfo]:
             continue
 
         # Use the first (usually only) plugin entry
-        plugin_info = plugin_list[0]
+        args.append((skill_name, marketplace, plugin_list[0]))
+
+    if not args:
+        return []
+
+    # Resolve repos first so each remote artifact is fetched once per repo, not per skill
+    repos = [get_github_repo_from_marketplace(marketplace, marketplaces) for _, marketplace, _ in args]
+    skills_by_repo: Dict[str, List[Tuple[str, Dict]]] = {}
+    for (skill_name, _, plugin_info), repo in zip(args, repos):
+        if repo:
+            skills_by_repo.setdefault(repo, []).append((skill_name, plugin_info))
+
+    remote_data: Dict[str, Tuple[Optional[Dict], Optional[str]]] = {}
+
+    if skills_by_repo:
+        # Remote fetches are network-bound; overlap them (capped to stay polite to GitHub)
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(skills_by_repo))) as executor:
+            remote_data.update(zip(skills_by_repo, executor.map(fetch_repo_remote_data, skills_by_repo, skills_by_repo.values())))
+
+    return [
+        check_skill_update(
+            skill_name,
+            marketplace,
+            plugin_info,
+            repo,
+            *remote_data.get(repo, (None, None))
+        )
+        for (skill_name, marketplace, plugin_info), repo in zip(args, repos)
+    ]
 
-        skill_info = check_skill_update(skill_name, marketplace, plugin_info, marketplaces)
-        results.append(skill_info)
 
-    return results
+def group_by_status(results: List[SkillInfo]) -> Dict[UpdateStatus, List[SkillInfo]]:
+    """Group results by update status, preserving order within each group."""
+    buckets: Dict[UpdateStatus, List[SkillInfo]] = {status: [] for status in UpdateStatus}
+    for r in results:
+        buckets[r.status].append(r)
+    return buckets
 
 
 def print_results(results: List[SkillInfo], as_json: bool = False):
@@ -310,58 +534,69 @@ def print_results(results: List[SkillInfo], as_json: bool = False):
                 "remote_commit_sha": r.remote_commit_sha,
                 "error_message": r.error_message
             })
-        print(json.dumps(output, indent=2))
+        # Write the serialized UTF-8 bytes directly instead of decoding for print()
+        sys.stdout.flush()
+        sys.stdout.buffer.write(json_dumps(output, indent=True) + b"\n")
+        sys.stdout.buffer.flush()
         return
 
-    # Group by status
-    up_to_date = [r for r in results if r.status == UpdateStatus.UP_TO_DATE]
-    updates_available = [r for r in results if r.status == UpdateStatus.UPDATE_AVAILABLE]
-    unknown = [r for r in results if r.status == UpdateStatus.UNKNOWN_VERSION]
-    errors = [r for r in results if r.status == UpdateStatus.ERROR]
+    # Group by status in a single pass
+    buckets = group_by_status(results)
+    up_to_date = buckets[UpdateStatus.UP_TO_DATE]
+    updates_available = buckets[UpdateStatus.UPDATE_AVAILABLE]
+    unknown = buckets[UpdateStatus.UNKNOWN_VERSION]
+    errors = buckets[UpdateStatus.ERROR]
+
+    out: List[str] = []
 
-    print(f"📦 {t('installed_skills_status')}")
-    print("━" * 26)
-    print()
+    out.append(f"📦 {t('installed_skills_status')}")
+    out.append("━" * 26)
+    out.append("")
 
     if up_to_date:
-        print(f"✅ {t('up_to_date')} ({len(up_to_date)}):")
+        out.append(f"✅ {t('up_to_date')} ({len(up_to_date)}):")
         for r in up_to_date:
             version_str = r.local_version
             if r.git_commit_sha and r.local_version in ["unknown", ""]:
                 version_str = r.git_commit_sha[:12]
-            print(f"   • {r.name}@{r.marketplace} ({version_str})")
-        print()
+            out.append(f"   • {r.name}@{r.marketplace} ({version_str})")
+        out.append("")
 
     if updates_available:
-        print(f"⬆️  {t('updates_available')} ({len(updates_available)}):")
+        out.append(f"⬆️  {t('updates_available')} ({len(updates_available)}):")
         for r in updates_available:
             local_str = r.local_version
             remote_str = r.remote_version or r.remote_commit_sha or "newer"
             if r.local_version in ["unknown", ""]:
                 local_str = r.git_commit_sha[:12] if r.git_commit_sha else "unknown"
-            print(f"   • {r.name}@{r.marketplace}")
-            print(f"     {t('local')}: {local_str} → {t('remote')}: {remote_str}")
-        print()
+            out.append(f"   • {r.name}@{r.marketplace}")
+            out.append(f"     {t('local')}: {local_str} → {t('remote')}: {remote_str}")
+        out.append("")
 
     if unknown:
-        print(f"⚠️  {t('unknown_version')} ({len(unknown)}):")
+        out.append(f"⚠️  {t('unknown_version')} ({len(unknown)}):")
         for r in unknown:
-            print(f"   • {r.name}@{r.marketplace} ({r.local_version})")
-        print()
+            out.append(f"   • {r.name}@{r.marketplace} ({r.local_version})")
+        out.append("")
 
     if errors:
-        print(f"❌ {t('errors')} ({len(errors)}):")
+        out.append(f"❌ {t('errors')} ({len(errors)}):")
         for r in errors:
-            print(f"   • {r.name}@{r.marketplace}: {r.error_message}")
-        print()
+            out.append(f"   • {r.name}@{r.marketplace}: {r.error_message}")
+        out.append("")
 
     # Summary
-    print("━" * 26)
-    print(f"{t('total')}: {len(results)} {t('skills')} | "
-          f"{len(updates_available)} {t('updates_available_count')}")
+    out.append("━" * 26)
+    out.append(f"{t('total')}: {len(results)} {t('skills')} | "
+               f"{len(updates_available)} {t('updates_available_count')}")
+
+    # Emit everything with a single write instead of one print per line
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Check for skill updates")
     parser.add_argument("--skill", help="Check specific skill only")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
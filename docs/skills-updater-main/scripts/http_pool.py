@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP connection pool for skills-updater scripts.
+
+Keeps keep-alive connections per (scheme, host) so repeated requests skip the
+TCP/TLS handshake. Uses only the standard library.
+"""
+
+import http.client
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Keep-alive connection pool shared by all fetches: (scheme, host) -> idle connections
+HTTP_TIMEOUT = 10
+HTTP_RETRIES = 2
+POOL_MAXSIZE = 16
+_pool: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+
+
+class HTTPError(Exception):
+    """Raised for unexpected HTTP status codes."""
+
+    def __init__(self, url: str, code: int):
+        super().__init__(f"HTTP {code} for {url}")
+        self.url = url
+        self.code = code
+
+
+def _acquire_connection(scheme: str, host: str, timeout: float) -> http.client.HTTPConnection:
+    """Take an idle pooled connection for host, or open a new one."""
+    with _pool_lock:
+        idle = _pool.get((scheme, host))
+        if idle:
+            return idle.pop()
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, timeout=timeout)
+    return http.client.HTTPConnection(host, timeout=timeout)
+
+
+def _release_connection(scheme: str, host: str, conn: http.client.HTTPConnection):
+    """Return a connection to the pool so later requests skip the TCP/TLS handshake."""
+    with _pool_lock:
+        idle = _pool.setdefault((scheme, host), [])
+        if len(idle) < POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def pooled_get(url: str, headers: Dict[str, str], timeout: float = HTTP_TIMEOUT,
+               max_bytes: Optional[int] = None) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    Perform one GET on a pooled keep-alive connection.
+
+    Retries on dropped connections and 502/503/504 responses with a short backoff.
+    The timeout applies to newly opened connections. With max_bytes, at most that
+    many bytes of the body are read and the rest is dropped with the connection.
+
+    Returns: (status, headers, body)
+    """
+    parts = urlsplit(url)
+    scheme, host = parts.scheme, parts.netloc
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+    attempt = 0
+    while True:
+        conn = _acquire_connection(scheme, host, timeout)
+        try:
+            conn.request("GET", path or "/", headers=headers)
+            response = conn.getresponse()
+            body = response.read(max_bytes) if max_bytes is not None else response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if attempt >= HTTP_RETRIES:
+                raise
+        else:
+            if response.will_close or not response.isclosed():
+                conn.close()
+            else:
+                _release_connection(scheme, host, conn)
+            if response.status not in (502, 503, 504) or attempt >= HTTP_RETRIES:
+                return response.status, response.headers, body
+        time.sleep(0.3 * (2 ** attempt))
+        attempt += 1
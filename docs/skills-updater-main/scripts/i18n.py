@@ -7,7 +7,8 @@ Supports: English (en), Chinese (zh)
 """
 
 import os
-import locale
+import sys
+from functools import lru_cache
 from typing import Dict, Optional
 
 
@@ -126,6 +127,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
 }
 
 
+@lru_cache(maxsize=1)
 def detect_locale() -> str:
     """
     Detect user's preferred language from environment.
@@ -139,17 +141,19 @@ def detect_locale() -> str:
     Returns: 'zh' for Chinese, 'en' for others
     """
     # Check environment variables
-    for env_var in ['LANG', 'LC_ALL', 'LANGUAGE', 'LC_MESSAGES']:
-        lang = os.environ.get(env_var, '')
-        if lang:
-            lang_lower = lang.lower()
-            if lang_lower.startswith('zh') or 'chinese' in lang_lower:
-                return 'zh'
-            elif lang_lower.startswith('en'):
-                return 'en'
-
-    # Try system locale
+    for env_var in ('LANG', 'LC_ALL', 'LANGUAGE', 'LC_MESSAGES'):
+        lang = os.environ.get(env_var)
+        if not lang:
+            continue
+        prefix = lang[:2].lower()
+        if prefix == 'zh' or 'chinese' in lang.lower():
+            return 'zh'
+        if prefix == 'en':
+            return 'en'
+
+    # Try system locale (imported lazily; only needed when no env var decides)
     try:
+        import locale
         system_locale = locale.getlocale()[0]
         if system_locale:
             if system_locale.lower().startswith('zh'):
@@ -161,6 +165,13 @@ def detect_locale() -> str:
     return 'en'
 
 
+class _FormatArgs(dict):
+    """Format arguments that leave unknown placeholders as-is instead of raising KeyError."""
+
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
 class I18n:
     """Internationalization helper class."""
 
@@ -172,7 +183,8 @@ class I18n:
             lang: Language code ('en', 'zh') or None for auto-detect
         """
         self.lang = lang or detect_locale()
-        self.translations = TRANSLATIONS.get(self.lang, TRANSLATIONS['en'])
+        # Merge over English once so missing keys resolve with a single lookup
+        self.translations = {**TRANSLATIONS['en'], **TRANSLATIONS.get(self.lang, {})}
 
     def t(self, key: str, **kwargs) -> str:
         """
@@ -185,19 +197,38 @@ class I18n:
         Returns:
             Translated and formatted string
         """
-        text = self.translations.get(key, TRANSLATIONS['en'].get(key, key))
-        if kwargs:
-            try:
-                return text.format(**kwargs)
-            except KeyError:
-                return text
-        return text
+        text = self.translations.get(key, key)
+        if not kwargs or '{' not in text:
+            return text
+        return text.format_map(_FormatArgs(kwargs))
 
     def is_chinese(self) -> bool:
         """Check if current language is Chinese."""
         return self.lang == 'zh'
 
 
+def ensure_utf8_stdio():
+    """
+    Make stdout/stderr UTF-8 on Windows consoles that use another encoding.
+
+    Streams that are already UTF-8 are left untouched, so calling this more
+    than once (e.g. from several scripts) never stacks wrappers.
+    """
+    if sys.platform != 'win32':
+        return
+
+    import io
+
+    for name in ('stdout', 'stderr'):
+        stream = getattr(sys, name)
+        if (stream.encoding or '').lower() in ('utf-8', 'utf8'):
+            continue
+        if hasattr(stream, 'reconfigure'):
+            stream.reconfigure(encoding='utf-8', errors='replace')
+        else:
+            setattr(sys, name, io.TextIOWrapper(stream.buffer, encoding='utf-8', errors='replace'))
+
+
 # Global instance for convenience
 _i18n: Optional[I18n] = None
 
@@ -212,16 +243,12 @@ def get_i18n(lang: Optional[str] = None) -> I18n:
 
 def t(key: str, **kwargs) -> str:
     """Convenience function for translation."""
-    return get_i18n().t(key, **kwargs)
+    return (_i18n or get_i18n()).t(key, **kwargs)
 
 
 if __name__ == "__main__":
-    import io
-    import sys
     # Fix Windows console encoding for test
-    if sys.platform == 'win32':
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    ensure_utf8_stdio()
 
     # Test locale detection
     print(f"Detected locale: {detect_locale()}")
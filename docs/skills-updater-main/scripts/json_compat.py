@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+JSON helpers for skills-updater scripts.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+
+# orjson is an optional speedup; fall back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
@@ -3,7 +3,7 @@
 Skill Recommender - Fetches trending and recommended skills from marketplaces.
 
 Usage:
-    python recommend_skills.py [--source <source>] [--limit <n>] [--json]
+    python recommend_skills.py [--source <source>] [--limit <n>] [--json [--pretty]] [--refresh]
 
 Sources:
     - skills.sh: Community skills leaderboard
@@ -14,33 +14,68 @@ Examples:
     python recommend_skills.py                     # Show trending from all sources
     python recommend_skills.py --source skills.sh  # Only skills.sh
     python recommend_skills.py --limit 10          # Show top 10
-    python recommend_skills.py --json              # Output as JSON
+    python recommend_skills.py --json              # Output as compact JSON
+    python recommend_skills.py --json --pretty     # Output as indented JSON
+    python recommend_skills.py --refresh           # Ignore the cached skills.sh list
 """
 
-import json
 import sys
 import argparse
+import itertools
 import re
-import io
+import time
+from functools import lru_cache
 from pathlib import Path
-
-# Fix Windows console encoding
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
-import urllib.request
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
 
-# Import i18n module
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+_INSTALL_RE = re.compile(r"([\d,.]+)\s*([km]?)\s*install", re.ASCII | re.IGNORECASE)
+_NUMERIC_RE = re.compile(r"\A[\d,.]+\Z", re.ASCII)
+_INSTALL_MULTIPLIERS = {"": 1, "k": 1000, "m": 1000000}
+
+# Display units for install counts, largest first
+_INSTALL_UNITS = ((1000000, "M"), (1000, "K"))
+
+# Upper bound on the skills.sh page size; anything beyond is not read
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Parsed skills.sh results younger than this many seconds are reused without fetching
+SKILLS_SH_CACHE_TTL = 3600
+
+# Category keywords matched (case-insensitively) anywhere in installed skill names
+_CATEGORY_PATTERNS = {
+    "developer-tools": re.compile(r"github|git|code", re.IGNORECASE),
+    "document-tools": re.compile(r"doc|pdf|ppt|excel|word", re.IGNORECASE),
+    "testing": re.compile(r"test|qa|playwright", re.IGNORECASE),
+    "frontend": re.compile(r"front|ui|design|css", re.IGNORECASE),
+    "security": re.compile(r"security|safe", re.IGNORECASE),
+    "learning": re.compile(r"learn|study|explain", re.IGNORECASE),
+}
+
+# Import sibling modules: relative imports when run as part of the scripts package
+# (python -m scripts.recommend_skills), otherwise from the script's own directory
 script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
-from i18n import get_i18n, t  # noqa: E402
+if __package__:
+    from .i18n import ensure_utf8_stdio, get_i18n, t
+    from .http_pool import HTTPError, pooled_get
+    from .json_compat import json_dumps, json_loads
+else:
+    sys.path.insert(0, str(script_dir))
+    from i18n import ensure_utf8_stdio, get_i18n, t
+    from http_pool import HTTPError, pooled_get
+    from json_compat import json_dumps, json_loads
+
+# Fix Windows console encoding
+ensure_utf8_stdio()
 
 
-@dataclass
-class RecommendedSkill:
+class RecommendedSkill(NamedTuple):
     name: str
     installs: Optional[int]
     source: str
@@ -94,55 +129,164 @@ class SkillsShParser(HTMLParser):
     def handle_data(self, data):
         if self.capture_text and self.in_skill_item:
             text = data.strip()
-            if not text:
-                return
-
-            # Try to extract install count
-            install_match = re.search(r"([\d,\.]+)\s*[kKmM]?\s*install", text, re.IGNORECASE)
-            if install_match:
-                count_str = install_match.group(1).replace(",", "")
-                try:
-                    count = float(count_str)
-                    if "k" in text.lower():
-                        count *= 1000
-                    elif "m" in text.lower():
-                        count *= 1000000
-                    self.current_skill["installs"] = int(count)
-                except Exception:
-                    pass
-
-            # Capture name (usually in h3/h4 or first significant text)
-            if self.current_tag in ["h3", "h4"] or "name" not in self.current_skill:
-                if len(text) > 2 and len(text) < 100 and not text.startswith("http"):
-                    if "install" not in text.lower() and not re.match(r"^[\d,\.]+$", text):
-                        self.current_skill["name"] = text
-
-
-def fetch_skills_sh(limit: int = 20) -> List[RecommendedSkill]:
-    """Fetch trending skills from skills.sh."""
+            if text:
+                apply_skill_text(self.current_skill, self.current_tag, text)
+
+
+def apply_skill_text(skill: Dict, tag: Optional[str], text: str):
+    """Extract install count and name from a text node of a skill card."""
+    # Try to extract install count
+    install_match = _INSTALL_RE.search(text)
+    if install_match:
+        count_str, suffix = install_match.groups()
+        try:
+            count = float(count_str.replace(",", ""))
+            skill["installs"] = int(count * _INSTALL_MULTIPLIERS[suffix.lower()])
+        except ValueError:
+            pass
+        return
+
+    # Capture name (usually in h3/h4 or first significant text)
+    if tag in ["h3", "h4"] or "name" not in skill:
+        if len(text) > 2 and len(text) < 100 and not text.startswith("http"):
+            if "install" not in text.lower() and _NUMERIC_RE.match(text) is None:
+                skill["name"] = text
+
+
+if lxml_html is not None:
+    _CARD_TEXT_TAGS = frozenset(["span", "p", "div", "h3", "h4"])
+    # Recovering parser: malformed markup is repaired in C instead of raising
+    _HTML_PARSER = lxml_html.HTMLParser(recover=True, encoding="utf-8")
+
+
+def _is_skill_card(el) -> bool:
+    """Same card test as SkillsShParser.handle_starttag."""
+    classes = el.get("class")
+    return bool(classes) and ("skill" in classes.lower() or "item" in classes.lower())
+
+
+def parse_skills_lxml(html: bytes) -> List[Dict]:
+    """Parse skills.sh leaderboard page with lxml's C parser.
+
+    Each card is walked with the same rules as SkillsShParser so both parsers
+    return the same entries: text is captured from the most recent span/p/div/h3/h4
+    (including inline children) until the next end tag, the first closing div
+    ends the card, and a card that opens before then (e.g. inside a
+    class="skills-list" wrapper) replaces the one being read.
+    """
+    try:
+        doc = lxml_html.fromstring(html, parser=_HTML_PARSER)
+    except lxml_html.etree.ParserError:
+        # Raised only when there is no element at all ("Document is empty")
+        return []
+    skills = []
+    events = ("start", "end", "comment", "pi")
+
+    for card in doc.iter("div"):
+        if not _is_skill_card(card):
+            continue
+        skill = {}
+        capture_tag = None
+        for event, el in lxml_html.etree.iterwalk(card, events=events):
+            tag = el.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions: only their tail is page text
+                if capture_tag is not None:
+                    text = (el.tail or "").strip()
+                    if text:
+                        apply_skill_text(skill, capture_tag, text)
+                continue
+            if event == "end":
+                if tag == "div":
+                    break
+                capture_tag = None
+                continue
+            if tag == "div" and el is not card and _is_skill_card(el):
+                # A nested card starts before this one closed a div: it is read on its own
+                skill = {}
+                break
+            if tag == "a":
+                href = el.get("href")
+                if href and ("github.com" in href or "/" in href):
+                    skill["repo"] = href
+            if tag in _CARD_TEXT_TAGS:
+                capture_tag = tag
+            if capture_tag is not None:
+                text = (el.text or "").strip()
+                if text:
+                    apply_skill_text(skill, capture_tag, text)
+        if skill.get("name"):
+            skills.append(skill)
+
+    return skills
+
+
+def parse_skills_html(html: bytes) -> List[Dict]:
+    """Parse skills.sh leaderboard page (UTF-8 bytes), preferring lxml when installed."""
+    if lxml_html is not None:
+        return parse_skills_lxml(html)
+
+    # html.parser is non-strict and does not raise on malformed markup either
+    parser = SkillsShParser()
+    parser.feed(html.decode("utf-8", "replace"))
+    parser.close()
+    return parser.skills
+
+
+def get_skills_sh_cache_file() -> Path:
+    """Path of the cached, parsed skills.sh leaderboard."""
+    return get_plugins_dir() / ".cache" / "skills_sh.json"
+
+
+def load_cached_skills_sh() -> Optional[List[RecommendedSkill]]:
+    """Return the cached skills.sh list if it is younger than SKILLS_SH_CACHE_TTL."""
+    cache_file = get_skills_sh_cache_file()
+    try:
+        if time.time() - cache_file.stat().st_mtime >= SKILLS_SH_CACHE_TTL:
+            return None
+        with open(cache_file, 'rb') as f:
+            return [RecommendedSkill(**item) for item in json_loads(f.read())]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_cached_skills_sh(skills: List[RecommendedSkill]):
+    """Store the parsed skills.sh list for later runs."""
+    cache_file = get_skills_sh_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            f.write(json_dumps([skill._asdict() for skill in skills]))
+    except OSError:
+        pass
+
+
+def fetch_skills_sh(limit: int = 20, refresh: bool = False) -> List[RecommendedSkill]:
+    """Fetch trending skills from skills.sh, reusing a recent on-disk copy unless refresh is set."""
+    if not refresh:
+        cached = load_cached_skills_sh()
+        if cached is not None:
+            return cached[:limit]
+
     url = "https://skills.sh/"
 
     try:
-        req = urllib.request.Request(url, headers={
+        status, _, body = pooled_get(url, {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) skills-updater/1.0"
-        })
-        with urllib.request.urlopen(req, timeout=15) as response:
-            html = response.read().decode("utf-8")
+        }, timeout=15, max_bytes=MAX_PAGE_BYTES)
+        if status != 200:
+            raise HTTPError(url, status)
     except Exception as e:
         print(f"Warning: Could not fetch skills.sh: {e}", file=sys.stderr)
         return get_hardcoded_skills_sh_top(limit)
 
     # Try to parse the page
-    parser = SkillsShParser()
-    try:
-        parser.feed(html)
-    except Exception:
-        pass
+    parsed = parse_skills_html(body)
 
     skills = []
 
-    if parser.skills:
-        for item in parser.skills[:limit]:
+    if parsed:
+        for item in parsed:
             if "name" in item:
                 repo = item.get("repo", "")
                 if repo.startswith("/"):
@@ -156,20 +300,28 @@ def fetch_skills_sh(limit: int = 20) -> List[RecommendedSkill]:
                     description=None,
                     install_command=f"npx skills add {repo}" if repo else f"npx skills add <owner>/{item['name']}"
                 ))
+        save_cached_skills_sh(skills)
     else:
         # Fallback to hardcoded top skills if parsing fails
         skills = get_hardcoded_skills_sh_top(limit)
 
-    return skills
+    return skills[:limit]
+
 
+@lru_cache(maxsize=1)
+def get_plugins_dir() -> Path:
+    """Get the Claude Code plugins directory (resolved once per process)."""
+    return Path.home() / ".claude" / "plugins"
 
+
+@lru_cache(maxsize=1)
 def load_recommendations_config() -> Dict:
-    """Load recommendations from external config file."""
+    """Load recommendations from external config file (parsed once; treat as read-only)."""
     config_file = script_dir / "recommendations.json"
     if config_file.exists():
         try:
-            with open(config_file, encoding='utf-8') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                return json_loads(f.read())
         except Exception:
             pass
     return {}
@@ -196,14 +348,14 @@ def get_hardcoded_skills_sh_top(limit: int = 20) -> List[RecommendedSkill]:
 
 def get_installed_categories() -> Set[str]:
     """Get categories of installed skills for personalized recommendations."""
-    plugins_file = Path.home() / ".claude" / "plugins" / "installed_plugins.json"
+    plugins_file = get_plugins_dir() / "installed_plugins.json"
 
     if not plugins_file.exists():
         return set()
 
     try:
-        with open(plugins_file, encoding='utf-8') as f:
-            data = json.load(f)
+        with open(plugins_file, 'rb') as f:
+            data = json_loads(f.read())
     except Exception:
         return set()
 
@@ -211,85 +363,78 @@ def get_installed_categories() -> Set[str]:
     categories = set()
 
     for key in data.get("plugins", {}).keys():
-        skill_name = key.split("@")[0]
-        # Common category keywords
-        if any(kw in skill_name.lower() for kw in ["github", "git", "code"]):
-            categories.add("developer-tools")
-        if any(kw in skill_name.lower() for kw in ["doc", "pdf", "ppt", "excel", "word"]):
-            categories.add("document-tools")
-        if any(kw in skill_name.lower() for kw in ["test", "qa", "playwright"]):
-            categories.add("testing")
-        if any(kw in skill_name.lower() for kw in ["front", "ui", "design", "css"]):
-            categories.add("frontend")
-        if any(kw in skill_name.lower() for kw in ["security", "safe"]):
-            categories.add("security")
-        if any(kw in skill_name.lower() for kw in ["learn", "study", "explain"]):
-            categories.add("learning")
+        skill_name = key.split("@", 1)[0]
+        for category, pattern in _CATEGORY_PATTERNS.items():
+            if pattern.search(skill_name):
+                categories.add(category)
 
     return categories
 
 
-def get_personalized_recommendations(installed_categories: Set[str], limit: int = 5) -> List[RecommendedSkill]:
-    """Get personalized skill recommendations based on installed categories."""
+@lru_cache(maxsize=1)
+def get_recommendation_index() -> Dict[str, Dict[str, Dict]]:
+    """Index category recommendations by category, then by skill name (built once)."""
     config = load_recommendations_config()
-    recommendations_by_category = config.get("category_recommendations", {})
-    default_recommendations = config.get("default_recommendations", [])
+    index: Dict[str, Dict[str, Dict]] = {}
+    for category, items in config.get("category_recommendations", {}).items():
+        by_name = index[category] = {}
+        for item in items:
+            name = item.get("name")
+            if name:
+                # A skill listed twice in a category keeps its first entry
+                by_name.setdefault(name, item)
+    return index
 
-    recommendations = []
-    seen_names = set()
 
-    # Add category-specific recommendations
+def get_personalized_recommendations(installed_categories: Set[str], limit: int = 5) -> List[RecommendedSkill]:
+    """Get personalized skill recommendations based on installed categories."""
+    index = get_recommendation_index()
+    default_recommendations = load_recommendations_config().get("default_recommendations", [])
+
+    # name -> (category, item); the first category to recommend a skill wins
+    candidates: Dict[str, Tuple[Optional[str], Dict]] = {}
     for category in installed_categories:
-        if category in recommendations_by_category:
-            for item in recommendations_by_category[category]:
-                name = item.get("name", "")
-                if name and name not in seen_names:
-                    recommendations.append(RecommendedSkill(
-                        name=name,
-                        installs=None,
-                        source="personalized",
-                        repo=item.get("repo"),
-                        description=item.get("description"),
-                        install_command=f"claude /install {name}",
-                        category=category
-                    ))
-                    seen_names.add(name)
+        for name, item in index.get(category, {}).items():
+            candidates.setdefault(name, (category, item))
 
     # Fill with defaults if needed
     for item in default_recommendations:
-        if len(recommendations) >= limit:
+        if len(candidates) >= limit:
             break
         name = item.get("name", "")
-        if name and name not in seen_names:
-            recommendations.append(RecommendedSkill(
-                name=name,
-                installs=None,
-                source="personalized",
-                repo=item.get("repo"),
-                description=item.get("description"),
-                install_command=f"claude /install {name}"
-            ))
-            seen_names.add(name)
-
-    return recommendations[:limit]
+        if name:
+            candidates.setdefault(name, (None, item))
+
+    return [
+        RecommendedSkill(
+            name=name,
+            installs=None,
+            source="personalized",
+            repo=item.get("repo"),
+            description=item.get("description"),
+            install_command=f"claude /install {name}",
+            category=category
+        )
+        for name, (category, item) in itertools.islice(candidates.items(), limit)
+    ]
 
 
+@lru_cache(maxsize=256)
 def format_installs(count: Optional[int]) -> str:
     """Format install count for display."""
     if count is None:
         return ""
 
-    if count >= 1000000:
-        return f"{count/1000000:.1f}M"
-    elif count >= 1000:
-        return f"{count/1000:.1f}K"
-    else:
-        return str(count)
+    for threshold, suffix in _INSTALL_UNITS:
+        if count >= threshold:
+            return f"{count / threshold:.1f}{suffix}"
+    return str(count)
 
 
 def print_recommendations(trending: List[RecommendedSkill],
                           personalized: List[RecommendedSkill],
-                          as_json: bool = False):
+                          as_json: bool = False,
+                          pretty: bool = False):
     """Print skill recommendations."""
     if as_json:
         output = {
@@ -315,42 +460,50 @@ def print_recommendations(trending: List[RecommendedSkill],
                 "install_command": skill.install_command
             })
 
-        print(json.dumps(output, indent=2, ensure_ascii=False))
+        # Compact by default for programmatic consumers; write the UTF-8 bytes directly
+        sys.stdout.flush()
+        sys.stdout.buffer.write(json_dumps(output, indent=pretty) + b"\n")
+        sys.stdout.buffer.flush()
         return
 
-    print(f"🔥 {t('trending_skills')}")
-    print("━" * 18)
-    print()
+    out: List[str] = []
+
+    out.append(f"🔥 {t('trending_skills')}")
+    out.append("━" * 18)
+    out.append("")
 
     if trending:
-        print(f"{t('from_skills_sh')} ({t('top_n', n=len(trending))}):")
+        out.append(f"{t('from_skills_sh')} ({t('top_n', n=len(trending))}):")
         for i, skill in enumerate(trending, 1):
             installs_str = format_installs(skill.installs)
             if installs_str:
                 installs_str = f" ({installs_str} {t('installs')})"
-            print(f"{i:2}. {skill.name}{installs_str}")
-            print(f"    {skill.install_command}")
-            print()
+            out.append(f"{i:2}. {skill.name}{installs_str}")
+            out.append(f"    {skill.install_command}")
+            out.append("")
     else:
-        print(t('could_not_fetch'))
-        print()
+        out.append(t('could_not_fetch'))
+        out.append("")
 
     if personalized:
-        print(f"💡 {t('personalized_recommendations')}")
-        print("━" * 31)
-        print()
-        print(t('based_on_installed'))
+        out.append(f"💡 {t('personalized_recommendations')}")
+        out.append("━" * 31)
+        out.append("")
+        out.append(t('based_on_installed'))
         for skill in personalized:
             category_str = f" [{skill.category}]" if skill.category else ""
-            print(f"• {skill.name}{category_str}")
+            out.append(f"• {skill.name}{category_str}")
             if skill.description:
-                print(f"  {skill.description}")
-            print(f"  → {skill.install_command}")
-            print()
+                out.append(f"  {skill.description}")
+            out.append(f"  → {skill.install_command}")
+            out.append("")
+
+    out.append("━" * 40)
+    out.append(t('install_hint'))
+    out.append(t('install_hint_npx'))
 
-    print("━" * 40)
-    print(t('install_hint'))
-    print(t('install_hint_npx'))
+    # Emit everything with a single write instead of one print per line
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -361,6 +514,10 @@ def main():
                         help="Number of trending skills to show")
     parser.add_argument("--json", action="store_true",
                         help="Output as JSON")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent JSON output")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Fetch skills.sh even if a cached copy is fresh")
     parser.add_argument("--lang", choices=["en", "zh"],
                         help="Language for output (auto-detected if not specified)")
     args = parser.parse_args()
@@ -375,19 +532,23 @@ def main():
     trending = []
     personalized = []
 
-    # Fetch trending skills
-    if args.source in ["skills.sh", "all"]:
-        trending = fetch_skills_sh(limit=args.limit)
+    # Fetch trending skills while installed categories are read from disk
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        trending_future = None
+        if args.source in ["skills.sh", "all"]:
+            trending_future = executor.submit(fetch_skills_sh, limit=args.limit, refresh=args.refresh)
+        installed_categories = get_installed_categories()
+        if trending_future is not None:
+            trending = trending_future.result()
 
     # Get personalized recommendations
-    installed_categories = get_installed_categories()
     if installed_categories:
         personalized = get_personalized_recommendations(installed_categories)
     else:
         # Default recommendations for new users
         personalized = get_personalized_recommendations(set(), limit=5)
 
-    print_recommendations(trending, personalized, as_json=args.json)
+    print_recommendations(trending, personalized, as_json=args.json, pretty=args.pretty)
 
 
 if __name__ == "__main__":
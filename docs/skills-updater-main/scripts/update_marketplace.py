@@ -11,28 +11,39 @@ Examples:
     python update_marketplace.py claude-plugins-official --json
 """
 
-import json
+import re
 import sys
 import argparse
 import subprocess
-import io
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Import sibling modules: relative imports when run as part of the scripts package
+# (python -m scripts.update_marketplace), otherwise from the script's own directory
+script_dir = Path(__file__).parent
+if __package__:
+    from .i18n import ensure_utf8_stdio, get_i18n, t
+    from .json_compat import json_dumps, json_loads
+else:
+    sys.path.insert(0, str(script_dir))
+    from i18n import ensure_utf8_stdio, get_i18n, t
+    from json_compat import json_dumps, json_loads
 
 # Fix Windows console encoding
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+ensure_utf8_stdio()
 
-# Import i18n module
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
-from i18n import get_i18n, t  # noqa: E402
+# ijson is optional; it lets installed_plugins.json be scanned without loading it whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
+# A full git object name (SHA-1 or SHA-256)
+_FULL_SHA_RE = re.compile(r"\A[0-9a-f]{40}(?:[0-9a-f]{24})?\Z")
 
-@dataclass
-class UpdateResult:
+
+class UpdateResult(NamedTuple):
     marketplace: str
     updated: bool
     local_commit: str
@@ -45,11 +56,22 @@ class UpdateResult:
     error: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
 def get_plugins_dir() -> Path:
-    """Get the Claude Code plugins directory."""
+    """Get the Claude Code plugins directory (resolved once per process)."""
     return Path.home() / ".claude" / "plugins"
 
 
+def get_installed_plugins_file() -> Path:
+    """Path of installed_plugins.json."""
+    return get_plugins_dir() / "installed_plugins.json"
+
+
+def get_pending_installs_file() -> Path:
+    """Path of the file collecting install commands for Claude Code to run."""
+    return get_plugins_dir() / ".pending_installs"
+
+
 def get_marketplace_dir(marketplace_name: str) -> Optional[Path]:
     """Get the marketplace directory path."""
     marketplace_dir = get_plugins_dir() / "marketplaces" / marketplace_name
@@ -58,82 +80,125 @@ def get_marketplace_dir(marketplace_name: str) -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=1)
 def load_installed_plugins() -> Dict:
-    """Load the installed_plugins.json file."""
-    plugins_file = get_plugins_dir() / "installed_plugins.json"
+    """Load the installed_plugins.json file (parsed once; treat as read-only)."""
+    plugins_file = get_installed_plugins_file()
     if not plugins_file.exists():
         return {"version": 2, "plugins": {}}
 
-    with open(plugins_file, encoding='utf-8') as f:
-        return json.load(f)
+    with open(plugins_file, 'rb') as f:
+        return json_loads(f.read())
 
 
+@lru_cache(maxsize=1)
 def load_known_marketplaces() -> Dict:
-    """Load the known_marketplaces.json file."""
+    """Load the known_marketplaces.json file (parsed once; treat as read-only)."""
     marketplaces_file = get_plugins_dir() / "known_marketplaces.json"
     if not marketplaces_file.exists():
         return {}
 
-    with open(marketplaces_file, encoding='utf-8') as f:
-        return json.load(f)
+    with open(marketplaces_file, 'rb') as f:
+        return json_loads(f.read())
+
+
+def iter_installed_plugin_keys() -> Iterator[str]:
+    """Yield the `skill@marketplace` keys of installed_plugins.json, streaming when ijson is available."""
+    plugins_file = get_installed_plugins_file()
+    if ijson is None or not plugins_file.exists():
+        yield from load_installed_plugins().get("plugins", {})
+        return
+
+    with open(plugins_file, 'rb') as f:
+        for key, _ in ijson.kvitems(f, "plugins"):
+            yield key
 
 
 def get_affected_skills(marketplace_name: str) -> List[str]:
     """Get list of installed skills from the specified marketplace."""
-    installed = load_installed_plugins()
-    affected = []
-
-    for key in installed.get("plugins", {}).keys():
-        if key.endswith(f"@{marketplace_name}"):
-            skill_name = key.rsplit("@", 1)[0]
-            affected.append(skill_name)
+    suffix = f"@{marketplace_name}"
+    suffix_len = len(suffix)
+    return [key[:-suffix_len] for key in iter_installed_plugin_keys() if key.endswith(suffix)]
 
-    return affected
 
+def get_git_common_dir(repo_dir: Path) -> Path:
+    """
+    Resolve the git directory holding the repository's refs.
 
+    Follows a `gitdir:` pointer file (worktrees, submodules) and a worktree's
+    `commondir` file back to the shared repository.
+    """
+    git_dir = repo_dir / ".git"
+    try:
+        if git_dir.is_file():
+            line = git_dir.read_text(encoding='utf-8').strip()
+            if line.startswith("gitdir:"):
+                git_dir = (repo_dir / line[len("gitdir:"):].strip()).resolve()
+        common = git_dir / "commondir"
+        if common.is_file():
+            git_dir = (git_dir / common.read_text(encoding='utf-8').strip()).resolve()
+    except OSError:
+        pass
+    return git_dir
+
+
+@lru_cache(maxsize=None)
 def get_default_branch(repo_dir: Path) -> str:
     """
     Detect the default branch of a git repository.
 
-    Tries multiple methods:
-    1. Check symbolic-ref of origin/HEAD
-    2. Check remote show origin
-    3. Fall back to 'main', then 'master'
+    Reads the ref files directly instead of spawning git:
+    1. refs/remotes/origin/HEAD (symbolic ref to the remote default branch)
+    2. origin/main, then origin/master, as loose refs or in packed-refs
+    3. Ask git (repositories whose refs are not plain files, e.g. reftable):
+       symbolic-ref of origin/HEAD, then origin/main, then origin/master
+    4. Fall back to 'main'
 
     Returns: branch name (e.g., 'main', 'master')
     """
-    # Method 1: Try symbolic-ref
-    result = subprocess.run(
-        ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True
-    )
-    if result.returncode == 0:
-        # Output like: refs/remotes/origin/main
-        ref = result.stdout.strip()
-        if ref:
-            return ref.split("/")[-1]
-
-    # Method 2: Check if origin/main exists
-    result = subprocess.run(
-        ["git", "rev-parse", "--verify", "origin/main"],
-        cwd=repo_dir,
-        capture_output=True,
-        text=True
-    )
-    if result.returncode == 0:
-        return "main"
+    git_dir = get_git_common_dir(repo_dir)
+    prefix = "refs/remotes/origin/"
 
-    # Method 3: Check if origin/master exists
+    # Method 1: origin/HEAD, e.g. "ref: refs/remotes/origin/main"
+    try:
+        head = (git_dir / "refs" / "remotes" / "origin" / "HEAD").read_text(encoding='utf-8').strip()
+    except OSError:
+        head = ""
+    if head.startswith("ref:"):
+        ref = head[len("ref:"):].strip()
+        if ref.startswith(prefix) and len(ref) > len(prefix):
+            return ref[len(prefix):]
+
+    # Method 2: origin/main or origin/master, loose or packed
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding='utf-8')
+    except OSError:
+        packed = ""
+    packed_refs = {line.split(" ", 1)[1] for line in packed.splitlines()
+                   if line and line[0] not in "#^" and " " in line}
+    for branch in ("main", "master"):
+        if (git_dir / "refs" / "remotes" / "origin" / branch).is_file() or prefix + branch in packed_refs:
+            return branch
+
+    # Method 3: refs not stored as files (e.g. reftable), let git resolve them
     result = subprocess.run(
-        ["git", "rev-parse", "--verify", "origin/master"],
+        ["git", "symbolic-ref", "--quiet", "refs/remotes/origin/HEAD"],
         cwd=repo_dir,
         capture_output=True,
         text=True
     )
-    if result.returncode == 0:
-        return "master"
+    ref = result.stdout.strip()
+    if result.returncode == 0 and ref.startswith(prefix) and len(ref) > len(prefix):
+        return ref[len(prefix):]
+    for branch in ("main", "master"):
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", prefix + branch],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            return branch
 
     # Default fallback
     return "main"
@@ -147,15 +212,7 @@ def git_fetch_and_check(marketplace_dir: Path) -> Tuple[str, str, int, List[str]
     """
     # Detect default branch
     default_branch = get_default_branch(marketplace_dir)
-
-    # Get local commit
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"],
-        cwd=marketplace_dir,
-        capture_output=True,
-        text=True
-    )
-    local_commit = result.stdout.strip()[:12] if result.returncode == 0 else "unknown"
+    remote_ref = f"origin/{default_branch}"
 
     # Fetch remote
     subprocess.run(
@@ -164,35 +221,35 @@ def git_fetch_and_check(marketplace_dir: Path) -> Tuple[str, str, int, List[str]
         capture_output=True
     )
 
-    # Get remote commit
-    result = subprocess.run(
-        ["git", "rev-parse", f"origin/{default_branch}"],
-        cwd=marketplace_dir,
-        capture_output=True,
-        text=True
-    )
-    remote_commit = result.stdout.strip()[:12] if result.returncode == 0 else "unknown"
-
-    # Count commits behind
+    # Resolve local and remote commits in one call; rev-parse echoes unresolvable
+    # arguments back verbatim, so each line is checked to be a full SHA
     result = subprocess.run(
-        ["git", "rev-list", f"HEAD..origin/{default_branch}", "--count"],
+        ["git", "rev-parse", "HEAD", remote_ref],
         cwd=marketplace_dir,
         capture_output=True,
         text=True
     )
-    commits_behind = int(result.stdout.strip()) if result.returncode == 0 else 0
-
-    # Get commit messages
+    local_sha, remote_sha = [
+        sha if _FULL_SHA_RE.match(sha) else None
+        for sha in (result.stdout.split() + ["", ""])[:2]
+    ]
+    local_commit = local_sha[:12] if local_sha else "unknown"
+    remote_commit = remote_sha[:12] if remote_sha else "unknown"
+
+    # One line per commit behind: the count and the messages come from the same call
+    commits_behind = 0
     commit_messages = []
-    if commits_behind > 0:
+    if local_sha and remote_sha and local_sha != remote_sha:
         result = subprocess.run(
-            ["git", "log", f"HEAD..origin/{default_branch}", "--oneline"],
+            ["git", "log", f"HEAD..{remote_ref}", "--oneline"],
             cwd=marketplace_dir,
             capture_output=True,
             text=True
         )
         if result.returncode == 0:
-            commit_messages = result.stdout.strip().split("\n")[:10]  # Limit to 10
+            lines = result.stdout.splitlines()
+            commits_behind = len(lines)
+            commit_messages = lines[:10]  # Limit to 10
 
     return local_commit, remote_commit, commits_behind, commit_messages
 
@@ -209,20 +266,21 @@ def git_pull(marketplace_dir: Path) -> bool:
     return result.returncode == 0
 
 
-def reinstall_skill(skill_name: str, marketplace_name: str) -> bool:
+def reinstall_skills(skill_names: List[str], marketplace_name: str) -> bool:
     """
-    Reinstall a skill using Claude Code's install mechanism.
+    Reinstall skills using Claude Code's install mechanism.
 
-    This generates an install command that should be executed by Claude Code.
+    This queues install commands that should be executed by Claude Code,
+    appending them to the pending installs file in a single write.
     """
-    # Generate the install command
-    install_cmd = f"/install {skill_name}@{marketplace_name}"
+    # Generate the install commands
+    install_cmds = "".join(f"/install {skill}@{marketplace_name}\n" for skill in skill_names)
 
-    # Write command to a temporary file that can be read by Claude
-    cmd_file = get_plugins_dir() / ".pending_installs"
+    # Write commands to a temporary file that can be read by Claude
+    cmd_file = get_pending_installs_file()
     try:
         with open(cmd_file, "a", encoding='utf-8') as f:
-            f.write(f"{install_cmd}\n")
+            f.write(install_cmds)
         return True
     except Exception:
         return False
@@ -285,21 +343,24 @@ def update_marketplace(
         )
 
     if interactive:
-        print(f"\n{t('current_commit')}: {local_commit}")
-        print(f"{t('remote_commit')}: {remote_commit}")
-        print(f"{t('status')}: {t('commits_behind', count=commits_behind)}")
+        # Build the summary as one string and write it once
+        out = [
+            f"\n{t('current_commit')}: {local_commit}",
+            f"{t('remote_commit')}: {remote_commit}",
+            f"{t('status')}: {t('commits_behind', count=commits_behind)}",
+        ]
 
         if commit_messages:
-            print(f"\n📝 {t('update_content')}:")
-            for msg in commit_messages[:5]:
-                print(f"   • {msg}")
+            out.append(f"\n📝 {t('update_content')}:")
+            out.extend(f"   • {msg}" for msg in commit_messages[:5])
             if len(commit_messages) > 5:
-                print(f"   ... +{len(commit_messages) - 5} more")
+                out.append(f"   ... +{len(commit_messages) - 5} more")
 
         if affected_skills:
-            print(f"\n📦 {t('affected_skills')}: {', '.join(affected_skills)}")
+            out.append(f"\n📦 {t('affected_skills')}: {', '.join(affected_skills)}")
         else:
-            print(f"\n📦 {t('no_affected_skills')}")
+            out.append(f"\n📦 {t('no_affected_skills')}")
+        sys.stdout.write("\n".join(out) + "\n")
 
     # Pull updates
     if interactive:
@@ -330,18 +391,20 @@ def update_marketplace(
         if interactive:
             print(f"\n🔄 {t('reinstalling_skills')}")
 
-        for skill in affected_skills:
-            if interactive:
-                print(f"   {t('reinstalling_skill', skill=skill)}")
+        if reinstall_skills(affected_skills, marketplace_name):
+            reinstalled = list(affected_skills)
+        else:
+            failed = list(affected_skills)
 
-            if reinstall_skill(skill, marketplace_name):
-                reinstalled.append(skill)
-                if interactive:
-                    print(f"   ✅ {t('skill_reinstalled', skill=skill)}")
-            else:
-                failed.append(skill)
-                if interactive:
-                    print(f"   ❌ {t('skill_reinstall_failed', skill=skill)}")
+        if interactive:
+            out = []
+            for skill in affected_skills:
+                out.append(f"   {t('reinstalling_skill', skill=skill)}")
+                if reinstalled:
+                    out.append(f"   ✅ {t('skill_reinstalled', skill=skill)}")
+                else:
+                    out.append(f"   ❌ {t('skill_reinstall_failed', skill=skill)}")
+            sys.stdout.write("\n".join(out) + "\n")
 
         if interactive and reinstalled:
             print(f"\n✅ {t('all_skills_updated')}")
@@ -373,12 +436,15 @@ def print_result_json(result: UpdateResult):
         "failed_skills": result.failed_skills,
         "error": result.error
     }
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    # Write the serialized UTF-8 bytes directly instead of decoding for print()
+    sys.stdout.flush()
+    sys.stdout.buffer.write(json_dumps(output, indent=True) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def get_pending_installs() -> List[str]:
     """Get list of pending skill installs."""
-    cmd_file = get_plugins_dir() / ".pending_installs"
+    cmd_file = get_pending_installs_file()
     if not cmd_file.exists():
         return []
 
@@ -421,11 +487,7 @@ def main():
     # Output pending installs for Claude to execute
     pending = get_pending_installs()
     if pending:
-        print("\n" + "=" * 40)
-        print("PENDING_SKILL_INSTALLS:")
-        for cmd in pending:
-            print(cmd)
-        print("=" * 40)
+        sys.stdout.write("\n".join(["\n" + "=" * 40, "PENDING_SKILL_INSTALLS:", *pending, "=" * 40]) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Tests for check_updates.py (run: python -m unittest discover tests)."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts import check_updates  # noqa: E402
+
+
+class CompareCommitShaTest(unittest.TestCase):
+    def test_case_is_ignored(self):
+        self.assertFalse(check_updates.compare_commit_sha("ABCDEF012345", "abcdef012345"))
+
+    def test_only_prefix_is_compared(self):
+        # Digits past SHA_PREFIX_LEN (12) do not count
+        self.assertFalse(check_updates.compare_commit_sha(
+            "e30768372b41" + "0" * 28, "e30768372b41" + "f" * 28))
+        self.assertFalse(check_updates.compare_commit_sha("e30768372b41", "e30768372b41aaaa"))
+        self.assertTrue(check_updates.compare_commit_sha("e30768372b41", "e30768372b42"))
+
+    def test_non_hex_falls_back_to_string_comparison(self):
+        self.assertFalse(check_updates.compare_commit_sha("local-build", "local-build"))
+        self.assertTrue(check_updates.compare_commit_sha("local-build", "local-buile"))
+
+    def test_missing_sha_is_not_an_update(self):
+        self.assertFalse(check_updates.compare_commit_sha(None, "e30768372b41"))
+        self.assertFalse(check_updates.compare_commit_sha("e30768372b41", ""))
+
+
+class CompareVersionsTest(unittest.TestCase):
+    def test_trailing_zeros_are_equal(self):
+        self.assertEqual(check_updates._parse_version("1.2"), check_updates._parse_version("1.2.0"))
+        self.assertFalse(check_updates.compare_versions("1.2", "1.2.0"))
+        self.assertFalse(check_updates.compare_versions("1.2.0", "1.2"))
+
+    def test_components_compare_numerically(self):
+        self.assertTrue(check_updates.compare_versions("1.2.0", "1.10"))
+        self.assertFalse(check_updates.compare_versions("1.10", "1.2.0"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for recommend_skills.py (run: python -m unittest discover tests)."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts import recommend_skills  # noqa: E402
+
+# Leaderboard fixture: a wrapper container whose class also contains "skill",
+# names nested inside inline children, and install counts in separate spans
+LEADERBOARD_HTML = b"""<html><body>
+<h1>Trending</h1>
+<div class="skills-list">
+  <div class="skill-card">
+    <h3><a href="https://github.com/vercel/react-best-practices">vercel-react-best-practices</a></h3>
+    <span>25.5K installs</span>
+  </div>
+  <div class="item"><span><a href="/webdesign/guidelines">web-design-guidelines</a></span>
+    <span><strong>19.2K</strong> installs</span>
+    <span>19,200 installs</span>
+  </div>
+  <div class="Leader-Item">
+    <!-- rank -->
+    <p>remotion-best-practices</p>
+    <span>2.2K installs</span>
+  </div>
+</div>
+</body></html>"""
+
+
+def parse_with_fallback(html: bytes):
+    parser = recommend_skills.SkillsShParser()
+    parser.feed(html.decode("utf-8", "replace"))
+    parser.close()
+    return parser.skills
+
+
+class ParseSkillsHtmlTest(unittest.TestCase):
+    def test_fallback_parser(self):
+        self.assertEqual(parse_with_fallback(LEADERBOARD_HTML), [
+            {"repo": "https://github.com/vercel/react-best-practices",
+             "name": "vercel-react-best-practices", "installs": 25500},
+            {"repo": "/webdesign/guidelines", "name": "web-design-guidelines", "installs": 19200},
+            {"name": "remotion-best-practices", "installs": 2200},
+        ])
+
+    @unittest.skipIf(recommend_skills.lxml_html is None, "lxml is not installed")
+    def test_lxml_matches_fallback(self):
+        self.assertEqual(
+            recommend_skills.parse_skills_lxml(LEADERBOARD_HTML),
+            parse_with_fallback(LEADERBOARD_HTML),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
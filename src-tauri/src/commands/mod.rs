@@ -1036,14 +1036,8 @@ pub async fn get_tool_skills_tree(tool_id: String) -> Result<Vec<FileNode>, Stri
             });
         }
         
-        // 排序：目录优先，然后按名称排序
-        nodes.sort_by(|a, b| {
-            match (a.is_dir, b.is_dir) {
-                (true, false) => std::cmp::Ordering::Less,
-                (false, true) => std::cmp::Ordering::Greater,
-                _ => a.name.to_lowercase().cmp(&b.name.to_lowercase()),
-            }
-        });
+        // 排序：目录优先，然后按名称排序（每个节点只计算一次小写名称）
+        nodes.sort_by_cached_key(|n| (!n.is_dir, n.name.to_lowercase()));
         
         Ok(nodes)
     }
@@ -6,6 +6,7 @@ use crate::i18n::validate_locale;
 use anyhow::Result;
 use rust_i18n::t;
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicUsize, Ordering};
 use tauri::State;
 
 /// 扫描所有已安装的 skills
@@ -21,62 +22,105 @@ pub async fn scan_all_installed_skills(
         .collect();
 
     let scanner = SecurityScanner::new();
+    let reports = scan_skill_dirs_parallel(&scanner, &installed_skills, &locale);
     let mut results = Vec::new();
 
-    for mut skill in installed_skills {
-        if let Some(local_path) = &skill.local_path {
-            // local_path 是目录路径，扫描整个目录
-            let path = PathBuf::from(local_path);
+    for (mut skill, scanned) in installed_skills.into_iter().zip(reports) {
+        match scanned {
+            // 目录不存在，已在扫描时记录
+            None => continue,
+            Some(Ok(report)) => {
+                // 更新 skill 的安全信息
+                skill.security_score = Some(report.score);
+                skill.security_level = Some(report.level.as_str().to_string());
+                skill.security_issues = Some(
+                    report.issues.iter()
+                        .map(|i| i.to_stored_string())
+                        .collect()
+                );
+                skill.scanned_at = Some(chrono::Utc::now());
 
-            // 检查目录是否存在
-            if !path.exists() || !path.is_dir() {
-                eprintln!("Skill directory does not exist: {:?}", path);
-                continue;
+                // 保存到数据库
+                if let Err(e) = state.db.save_skill(&skill) {
+                    eprintln!("Failed to save skill {}: {}", skill.name, e);
+                }
+
+                results.push(SkillScanResult {
+                    skill_id: skill.id.clone(),
+                    skill_name: skill.name.clone(),
+                    score: report.score,
+                    level: report.level.as_str().to_string(),
+                    scanned_at: chrono::Utc::now().to_rfc3339(),
+                    report,
+                });
+            }
+            Some(Err(e)) => {
+                eprintln!("Failed to scan skill {}: {}", skill.name, e);
             }
+        }
+    }
 
-            match scanner.scan_directory(
-                path.to_str().unwrap_or(""),
-                &skill.id,
-                &locale
-            ) {
-                Ok(report) => {
-                    // 更新 skill 的安全信息
-                    skill.security_score = Some(report.score);
-                    skill.security_level = Some(report.level.as_str().to_string());
-                    skill.security_issues = Some(
-                        report.issues.iter()
-                            .map(|i| {
-                                let file_info = i.file_path.as_ref()
-                                    .map(|f| format!("[{}] ", f))
-                                    .unwrap_or_default();
-                                format!("{}{:?}: {}", file_info, i.severity, i.description)
-                            })
-                            .collect()
-                    );
-                    skill.scanned_at = Some(chrono::Utc::now());
+    Ok(results)
+}
+
+/// 并行扫描多个 skill 目录，返回结果与输入顺序一致
+///
+/// 各 skill 的扫描互不依赖（各自读取文件并匹配规则），按 CPU 核数启动工作线程；
+/// 目录不存在的 skill 对应 None。
+fn scan_skill_dirs_parallel(
+    scanner: &SecurityScanner,
+    skills: &[Skill],
+    locale: &str,
+) -> Vec<Option<Result<SecurityReport>>> {
+    let workers = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(skills.len())
+        .max(1);
+    let next = AtomicUsize::new(0);
+    let next = &next;
+
+    let scanned: Vec<(usize, Result<SecurityReport>)> = std::thread::scope(|s| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| s.spawn(move || {
+                let mut out = Vec::new();
+                loop {
+                    let idx = next.fetch_add(1, Ordering::Relaxed);
+                    let Some(skill) = skills.get(idx) else { break };
+                    let Some(local_path) = &skill.local_path else { continue };
 
-                    // 保存到数据库
-                    if let Err(e) = state.db.save_skill(&skill) {
-                        eprintln!("Failed to save skill {}: {}", skill.name, e);
+                    // local_path 是目录路径，扫描整个目录
+                    let path = PathBuf::from(local_path);
+
+                    // 检查目录是否存在（单次 metadata 调用）
+                    if !path.metadata().map(|m| m.is_dir()).unwrap_or(false) {
+                        eprintln!("Skill directory does not exist: {:?}", path);
+                        continue;
                     }
 
-                    results.push(SkillScanResult {
-                        skill_id: skill.id.clone(),
-                        skill_name: skill.name.clone(),
-                        score: report.score,
-                        level: report.level.as_str().to_string(),
-                        scanned_at: chrono::Utc::now().to_rfc3339(),
-                        report,
-                    });
-                }
-                Err(e) => {
-                    eprintln!("Failed to scan skill {}: {}", skill.name, e);
+                    // 已经按技能并行，单个目录内不再额外开线程
+                    out.push((idx, scanner.scan_directory_with_threads(
+                        path.to_str().unwrap_or(""),
+                        &skill.id,
+                        locale,
+                        1,
+                    )));
                 }
-            }
-        }
-    }
+                out
+            }))
+            .collect();
 
-    Ok(results)
+        // 工作线程 panic 时原样抛出：不能让它负责的技能从扫描结果中静默消失
+        handles.into_iter()
+            .flat_map(|h| h.join().unwrap_or_else(|e| std::panic::resume_unwind(e)))
+            .collect()
+    });
+
+    let mut reports: Vec<Option<Result<SecurityReport>>> = skills.iter().map(|_| None).collect();
+    for (idx, report) in scanned {
+        reports[idx] = Some(report);
+    }
+    reports
 }
 
 /// 获取缓存的扫描结果
@@ -197,13 +241,16 @@ pub async fn scan_skill_archive(
     let locale = validate_locale(&locale);
     let scanner = SecurityScanner::new();
 
-    // 验证文件存在性
+    // 验证文件存在性（单次 metadata 调用）
     let path = std::path::Path::new(&archive_path);
-    if !path.exists() {
-        return Err(t!("common.errors.file_not_found", locale = locale, path = &archive_path).to_string());
-    }
-    if !path.is_file() {
-        return Err(t!("common.errors.path_not_file", locale = locale, path = &archive_path).to_string());
+    match path.metadata() {
+        Err(_) => {
+            return Err(t!("common.errors.file_not_found", locale = locale, path = &archive_path).to_string());
+        }
+        Ok(meta) if !meta.is_file() => {
+            return Err(t!("common.errors.path_not_file", locale = locale, path = &archive_path).to_string());
+        }
+        Ok(_) => {}
     }
 
     // 读取文件内容
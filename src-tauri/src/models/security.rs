@@ -56,6 +56,16 @@ pub struct SecurityIssue {
     pub file_path: Option<String>,  // 记录哪个文件有风险
 }
 
+impl SecurityIssue {
+    /// 存入数据库的单行摘要，格式: "[filename] Severity: description"
+    pub fn to_stored_string(&self) -> String {
+        match &self.file_path {
+            Some(f) => format!("[{}] {:?}: {}", f, self.severity, self.description),
+            None => format!("{:?}: {}", self.severity, self.description),
+        }
+    }
+}
+
 /// 问题严重程度
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub enum IssueSeverity {
@@ -1,4 +1,4 @@
-use regex::Regex;
+use regex::{Regex, RegexBuilder, RegexSet};
 use lazy_static::lazy_static;
 use serde::{Deserialize, Serialize};
 
@@ -46,6 +46,7 @@ pub struct PatternRule {
     pub confidence: Confidence,           // 新增
     pub remediation: &'static str,        // 新增：修复建议
     pub cwe_id: Option<&'static str>,     // 新增：CWE 编号
+    pub issue_description: String,        // 问题描述 "name: description"，加载规则时生成一次
 }
 
 impl PatternRule {
@@ -74,6 +75,7 @@ impl PatternRule {
             confidence,      // 新增
             remediation,     // 新增
             cwe_id,          // 新增
+            issue_description: format!("{}: {}", name, description),
         }
     }
 }
@@ -654,6 +656,27 @@ lazy_static! {
     pub static ref HARD_TRIGGER_RULES: Vec<&'static PatternRule> = {
         PATTERN_RULES.iter().filter(|r| r.hard_trigger).collect()
     };
+
+    /// 所有规则合并成的正则集合：一次扫描即可得到命中的规则下标
+    pub static ref PATTERN_SET: RegexSet = RegexSet::new(
+        PATTERN_RULES.iter().map(|r| r.pattern.as_str())
+    ).expect("Invalid regex pattern");
+
+    /// 所有规则合并成的单个交替表达式 `(?:p0)|(?:p1)|...`，按整段文本匹配：
+    /// ^/$ 匹配行边界（含 \r\n），`.` 可匹配任意字符。
+    /// 逐行能命中的规则在整段文本上一定也能命中，用于跳过不可能命中的文件。
+    pub static ref FILE_PATTERN: Regex = RegexBuilder::new(
+        &PATTERN_RULES
+            .iter()
+            .map(|r| format!("(?:{})", r.pattern.as_str()))
+            .collect::<Vec<_>>()
+            .join("|")
+    )
+    .multi_line(true)
+    .crlf(true)
+    .dot_matches_new_line(true)
+    .build()
+    .expect("Invalid regex pattern");
 }
 
 pub struct SecurityRules;
@@ -664,8 +687,18 @@ impl SecurityRules {
         &PATTERN_RULES
     }
 
-    /// 获取所有硬触发规则
-    pub fn get_hard_triggers() -> Vec<&'static PatternRule> {
-        PATTERN_RULES.iter().filter(|r| r.hard_trigger).collect()
+    /// 单次扫描一行文本，按规则定义顺序返回所有命中的规则
+    pub fn match_line(line: &str) -> impl Iterator<Item = &'static PatternRule> {
+        PATTERN_SET.matches(line).into_iter().map(|idx| &PATTERN_RULES[idx])
+    }
+
+    /// 对整段文本做一次预筛：返回 false 时任何一行都不会命中规则
+    pub fn may_match(content: &str) -> bool {
+        FILE_PATTERN.is_match(content)
+    }
+
+    /// 获取所有硬触发规则（首次访问时筛选一次，之后复用）
+    pub fn get_hard_triggers() -> &'static Vec<&'static PatternRule> {
+        &HARD_TRIGGER_RULES
     }
 }
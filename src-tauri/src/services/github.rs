@@ -41,6 +41,35 @@ struct SkillFrontmatter {
     description: Option<String>,
 }
 
+/// 截取 SKILL.md 开头两行 `---` 之间的 frontmatter 原文（借用 content，不复制）
+///
+/// 只扫描到闭合的 `---` 为止，不会把整个文件拆成行再拼接。
+pub fn extract_frontmatter(content: &str) -> Result<&str> {
+    // 与 str::lines 一致：去掉行尾的 \n 或 \r\n
+    fn trim_eol(line: &str) -> &str {
+        match line.strip_suffix('\n') {
+            Some(line) => line.strip_suffix('\r').unwrap_or(line),
+            None => line,
+        }
+    }
+
+    let mut lines = content.split_inclusive('\n');
+    let first = lines.next().unwrap_or("");
+    if trim_eol(first) != "---" {
+        anyhow::bail!("Invalid SKILL.md format: missing frontmatter");
+    }
+
+    let start = first.len();
+    let mut end = start;
+    for line in lines {
+        if trim_eol(line) == "---" {
+            return Ok(&content[start..end]);
+        }
+        end += line.len();
+    }
+    anyhow::bail!("Invalid SKILL.md format: frontmatter not closed")
+}
+
 pub struct GitHubService {
     client: Client,
     api_base: String,
@@ -343,24 +372,10 @@ impl GitHubService {
     /// 解析 SKILL.md 的 frontmatter
     pub fn parse_skill_frontmatter(&self, content: &str) -> Result<(String, Option<String>)> {
         // 查找 frontmatter 的边界（--- ... ---）
-        let lines: Vec<&str> = content.lines().collect();
-
-        if lines.is_empty() || lines[0] != "---" {
-            anyhow::bail!("Invalid SKILL.md format: missing frontmatter");
-        }
-
-        // 找到第二个 "---"
-        let end_index = lines.iter()
-            .skip(1)
-            .position(|&line| line == "---")
-            .context("Invalid SKILL.md format: frontmatter not closed")?;
-
-        // 提取 frontmatter 内容（跳过第一个 "---"）
-        let frontmatter_lines = &lines[1..=end_index];
-        let frontmatter_str = frontmatter_lines.join("\n");
+        let frontmatter_str = extract_frontmatter(content)?;
 
         // 解析 YAML
-        let frontmatter: SkillFrontmatter = serde_yaml::from_str(&frontmatter_str)
+        let frontmatter: SkillFrontmatter = serde_yaml::from_str(frontmatter_str)
             .context("Failed to parse SKILL.md frontmatter as YAML")?;
 
         Ok((frontmatter.name, frontmatter.description))
@@ -558,27 +573,50 @@ impl GitHubService {
 
         log::info!("找到仓库根目录: {:?}", root_dir);
 
-        // 遍历本地文件系统
+        // 遍历本地文件系统：直接从遍历结果中识别 SKILL.md（文件名不区分大小写），
+        // 不再对每个目录额外 stat 一次。多遍历一层，保持原先“目录深度 ≤ max_depth”的范围。
+        // 同一目录只保留一个候选（优先精确的 SKILL.md），避免 SKILL.md 与 skill.md 并存时重复
+        let mut candidates: Vec<(PathBuf, bool)> = Vec::new(); // (skill 目录, 是否有精确的 SKILL.md)
+        let mut seen: std::collections::HashMap<PathBuf, usize> = std::collections::HashMap::new();
         for entry in WalkDir::new(&root_dir)
-            .max_depth(max_depth)
+            .max_depth(max_depth + 1)
             .into_iter()
             .filter_map(|e| e.ok())
         {
             if entry.file_type().is_dir() {
-                // 检查是否包含SKILL.md
-                let skill_md_path = entry.path().join("SKILL.md");
-                if skill_md_path.exists() {
-                    log::info!("发现skill: {:?}", entry.path());
-
-                    // 读取并解析SKILL.md
-                    match self.parse_skill_from_file(&skill_md_path, entry.path(), &root_dir, repo_url) {
-                        Ok(skill) => skills.push(skill),
-                        Err(e) => log::warn!("解析skill失败 {:?}: {}", entry.path(), e),
-                    }
+                continue;
+            }
+            let Some(name) = entry.file_name().to_str() else { continue };
+            if !name.eq_ignore_ascii_case("SKILL.md") {
+                continue;
+            }
+            let Some(skill_dir) = entry.path().parent() else { continue };
+            let exact = name == "SKILL.md";
+            match seen.get(skill_dir) {
+                Some(&idx) => candidates[idx].1 |= exact,
+                None => {
+                    seen.insert(skill_dir.to_path_buf(), candidates.len());
+                    candidates.push((skill_dir.to_path_buf(), exact));
                 }
             }
         }
 
+        for (skill_dir, exact) in candidates {
+            // 安装时按 SKILL.md 查找：只有 skill.md 等其它大小写时，仅在大小写不敏感的
+            // 文件系统（macOS/Windows）上能找到，大小写敏感的文件系统上跳过
+            let skill_md = skill_dir.join("SKILL.md");
+            if !exact && !skill_md.exists() {
+                continue;
+            }
+            log::info!("发现skill: {:?}", skill_dir);
+
+            // 读取并解析SKILL.md
+            match self.parse_skill_from_file(&skill_md, &skill_dir, &root_dir, repo_url) {
+                Ok(skill) => skills.push(skill),
+                Err(e) => log::warn!("解析skill失败 {:?}: {}", skill_dir, e),
+            }
+        }
+
         log::info!("本地扫描完成，发现 {} 个skills", skills.len());
 
         Ok(skills)
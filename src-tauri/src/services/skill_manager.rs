@@ -193,17 +193,18 @@ impl SkillManager {
             self.install_from_network(&skill, &skill_dir).await?;
         }
 
-        // 从缓存读取 SKILL.md 进行元数据提取
+        // 从缓存读取 SKILL.md 进行元数据提取（直接读取，不存在时跳过）
         let skill_md_path = skill_dir.join("SKILL.md");
-        if skill_md_path.exists() {
-            let skill_md_content = std::fs::read_to_string(&skill_md_path)
-                .context("读取 SKILL.md 失败")?;
-
-            // 解析 frontmatter
-            if let Ok((name, description)) = self.github.parse_skill_frontmatter(&skill_md_content) {
-                skill.name = name;
-                skill.description = description;
+        match std::fs::read_to_string(&skill_md_path) {
+            Ok(skill_md_content) => {
+                // 解析 frontmatter
+                if let Ok((name, description)) = self.github.parse_skill_frontmatter(&skill_md_content) {
+                    skill.name = name;
+                    skill.description = description;
+                }
             }
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+            Err(e) => return Err(e).context("读取 SKILL.md 失败"),
         }
 
         // 扫描整个技能目录
@@ -239,12 +240,7 @@ impl SkillManager {
             skill.security_level = Some(scan_report.level.as_str().to_string());
             skill.security_issues = Some(
                 scan_report.issues.iter()
-                    .map(|i| {
-                        let file_info = i.file_path.as_ref()
-                            .map(|f| format!("[{}] ", f))
-                            .unwrap_or_default();
-                        format!("{}{:?}: {}", file_info, i.severity, i.description)
-                    })
+                    .map(|i| i.to_stored_string())
                     .collect()
             );
             skill.scanned_at = Some(Utc::now());
@@ -338,12 +334,7 @@ impl SkillManager {
         skill.security_level = Some(scan_report.level.as_str().to_string());
         skill.security_issues = Some(
             scan_report.issues.iter()
-                .map(|i| {
-                    let file_info = i.file_path.as_ref()
-                        .map(|f| format!("[{}] ", f))
-                        .unwrap_or_default();
-                    format!("{}{:?}: {}", file_info, i.severity, i.description)
-                })
+                .map(|i| i.to_stored_string())
                 .collect()
         );
         skill.scanned_at = Some(Utc::now());
@@ -834,13 +825,8 @@ impl SkillManager {
                     continue;
                 }
 
-                // 检查是否包含 SKILL.md
+                // 读取 SKILL.md 内容（直接读取，不包含 SKILL.md 的目录跳过）
                 let skill_md_path = path.join("SKILL.md");
-                if !skill_md_path.exists() {
-                    continue;
-                }
-
-                // 读取 SKILL.md 内容
                 match std::fs::read_to_string(&skill_md_path) {
                     Ok(content) => {
                         // 计算 checksum
@@ -909,14 +895,7 @@ impl SkillManager {
                                 report
                                     .issues
                                     .iter()
-                                    .map(|i| {
-                                        let file_info = i
-                                            .file_path
-                                            .as_ref()
-                                            .map(|f| format!("[{}] ", f))
-                                            .unwrap_or_default();
-                                        format!("{}{:?}: {}", file_info, i.severity, i.description)
-                                    })
+                                    .map(|i| i.to_stored_string())
                                     .collect(),
                             );
                             existing_skill.security_level = Some(match report.level {
@@ -965,12 +944,7 @@ impl SkillManager {
                             security_score: Some(report.score),
                             security_issues: Some(
                                 report.issues.iter()
-                                    .map(|i| {
-                                        let file_info = i.file_path.as_ref()
-                                            .map(|f| format!("[{}] ", f))
-                                            .unwrap_or_default();
-                                        format!("{}{:?}: {}", file_info, i.severity, i.description)
-                                    })
+                                    .map(|i| i.to_stored_string())
                                     .collect()
                             ),
                             security_level: Some(match report.level {
@@ -991,6 +965,7 @@ impl SkillManager {
 
                         log::info!("Imported local skill: {:?}", path);
                     }
+                    Err(e) if e.kind() == std::io::ErrorKind::NotFound => continue,
                     Err(e) => {
                         log::warn!("Failed to read skill file {:?}: {}", skill_md_path, e);
                     }
@@ -1006,27 +981,14 @@ impl SkillManager {
 
     /// 解析 SKILL.md 的 frontmatter
     fn parse_frontmatter(&self, content: &str) -> Result<(String, Option<String>)> {
-        let lines: Vec<&str> = content.lines().collect();
-
-        if lines.is_empty() || lines[0] != "---" {
-            anyhow::bail!("Invalid SKILL.md format: missing frontmatter");
-        }
-
-        // 找到第二个 "---"
-        let end_index = lines.iter()
-            .skip(1)
-            .position(|&line| line == "---")
-            .context("Invalid SKILL.md format: frontmatter not closed")?;
-
         // 提取 frontmatter 内容
-        let frontmatter_lines = &lines[1..=end_index];
-        let _frontmatter_str = frontmatter_lines.join("\n");
+        let frontmatter = crate::services::github::extract_frontmatter(content)?;
 
         // 简单的 YAML 解析（只提取 name 和 description）
         let mut name = String::new();
         let mut description: Option<String> = None;
 
-        for line in frontmatter_lines {
+        for line in frontmatter.lines() {
             if let Some(stripped) = line.strip_prefix("name:") {
                 name = stripped.trim().to_string();
             } else if let Some(stripped) = line.strip_prefix("description:") {